@@ -13,6 +13,7 @@ from itertools import compress
 
 import numpy as np
 from joblib import Parallel, delayed
+from numba import njit
 from sklearn.utils import check_random_state
 from sklearn.utils.multiclass import class_distribution
 
@@ -488,6 +489,7 @@ class IndividualBOSS(BaseClassifier):
         self.transformed_data = []
         self.accuracy = 0
         self.subsample = []
+        self._array_bags = False
 
         self.class_vals = []
         self.num_classes = 0
@@ -512,6 +514,7 @@ class IndividualBOSS(BaseClassifier):
 
         sfa = self.transformer.fit_transform(X)
         self.transformed_data = sfa[0]
+        self._array_bags = False
 
         self.class_vals = y
         self.num_classes = np.unique(y).shape[0]
@@ -538,6 +541,8 @@ class IndividualBOSS(BaseClassifier):
 
         test_bags = self.transformer.transform(X)
         test_bags = test_bags[0]
+        if self._array_bags:
+            test_bags = [self._bag_to_arrays(bag) for bag in test_bags]
 
         classes = Parallel(n_jobs=self.n_jobs)(
             delayed(self._test_nn)(
@@ -624,6 +629,32 @@ class IndividualBOSS(BaseClassifier):
         self.transformer.words = None
         self.transformer.save_words = False
 
+    def _use_array_bags(self):
+        # store each histogram as sorted word and count arrays, packed into the
+        # smallest types the words and counts fit in
+        if self.transformer.word_bits > 64:
+            return
+
+        self.transformed_data = [
+            self._bag_to_arrays(bag) for bag in self.transformed_data
+        ]
+        self._array_bags = True
+
+    def _bag_to_arrays(self, bag):
+        words = np.fromiter(
+            bag.keys(),
+            dtype=np.uint32 if self.transformer.word_bits <= 32 else np.int64,
+            count=len(bag),
+        )
+        counts = np.fromiter(
+            bag.values(),
+            dtype=np.uint16 if self.transformer.series_length < 2 ** 16 else np.uint32,
+            count=len(bag),
+        )
+
+        order = np.argsort(words)
+        return words[order], counts[order]
+
     def _set_word_len(self, word_len):
         self.word_length = word_len
         self.transformer.word_length = word_len
@@ -642,15 +673,15 @@ def boss_distance(first, second, best_dist=sys.float_info.max):
     of words.
 
     This distance function is designed for sparse matrix, represented as either a
-    dictionary or an arrray. It only measures the distance between counts present in
-    the first dictionary and the second. Hence dist(a,b) does not necessarily equal
-    dist(b,a).
+    dictionary, a tuple of sorted word and count arrays or an arrray. It only
+    measures the distance between counts present in the first dictionary and the
+    second. Hence dist(a,b) does not necessarily equal dist(b,a).
 
     Parameters
     ----------
-    first : dict
+    first : dict, tuple of arrays or array
         Base dictionary used in distance measurement.
-    second : dict
+    second : dict, tuple of arrays or array
         Second dictionary that will be used to measure distance from `first`.
     best_dist : int, float or sys.float_info.max
         Largest distance value. Values above this will be replaced by
@@ -671,6 +702,13 @@ def boss_distance(first, second, best_dist=sys.float_info.max):
 
             if dist > best_dist:
                 return sys.float_info.max
+    elif isinstance(first, tuple):
+        dist = _boss_distance_sorted(
+            first[0], first[1], second[0], second[1], best_dist
+        )
+
+        if dist > best_dist:
+            return sys.float_info.max
     else:
         dist = np.sum(
             [
@@ -680,3 +718,26 @@ def boss_distance(first, second, best_dist=sys.float_info.max):
         )
 
     return dist
+
+
+@njit(fastmath=True, cache=True)
+def _boss_distance_sorted(
+    first_words, first_counts, second_words, second_counts, best_dist
+):
+    dist = 0.0
+    n = 0
+
+    # both word arrays are sorted, so matching words are found with a single merge
+    for i in range(len(first_words)):
+        while n < len(second_words) and second_words[n] < first_words[i]:
+            n += 1
+
+        buf = np.int64(first_counts[i])
+        if n < len(second_words) and second_words[n] == first_words[i]:
+            buf -= np.int64(second_counts[n])
+        dist += buf * buf
+
+        if dist > best_dist:
+            break
+
+    return dist
@@ -9,7 +9,6 @@ __author__ = ["MatthewMiddlehurst", "BINAYKUMAR943"]
 
 __all__ = ["ContractableBOSS"]
 
-import math
 import time
 
 import numpy as np
@@ -19,6 +18,7 @@ from sklearn.utils.multiclass import class_distribution
 
 from sktime.classification.base import BaseClassifier
 from sktime.classification.dictionary_based import IndividualBOSS
+from sktime.utils.validation import check_n_jobs
 
 
 class ContractableBOSS(BaseClassifier):
@@ -78,7 +78,7 @@ class ContractableBOSS(BaseClassifier):
         Length of all series (assumed equal).
     classifiers : list
        List of DecisionTree classifiers.
-    weights :
+    weights : np.ndarray of shape (n_estimators,)
         Weight of each classifier in the ensemble.
     class_dictionary: dict
         Dictionary of classes. Extracted from the data.
@@ -145,6 +145,8 @@ class ContractableBOSS(BaseClassifier):
         self.n_jobs = n_jobs
         self.random_state = random_state
 
+        self._n_jobs = n_jobs
+
         self.classifiers = []
         self.weights = []
         self.weight_sum = 0
@@ -179,6 +181,8 @@ class ContractableBOSS(BaseClassifier):
         -------
         self : object
         """
+        self._n_jobs = check_n_jobs(self.n_jobs)
+
         time_limit = self.time_limit_in_minutes * 60
         self.n_instances, _, self.series_length = X.shape
         self.n_classes = np.unique(y).shape[0]
@@ -187,7 +191,6 @@ class ContractableBOSS(BaseClassifier):
             self.class_dictionary[classVal] = index
 
         self.classifiers = []
-        self.weights = []
 
         # Window length parameter space dependent on series length
         max_window_searches = self.series_length / 4
@@ -206,6 +209,14 @@ class ContractableBOSS(BaseClassifier):
                 f"all with very short series"
             )
         possible_parameters = self._unique_parameters(max_window, win_inc)
+        n_parameters = len(possible_parameters)
+
+        # member weights and accuracies are kept in arrays alongside the list of
+        # classifiers, the ensemble cannot grow larger than the parameter space
+        ensemble_size = min(self.max_ensemble_size, n_parameters)
+        self.weights = np.zeros(ensemble_size)
+        accuracies = np.zeros(ensemble_size)
+
         num_classifiers = 0
         start_time = time.time()
         train_time = 0
@@ -215,56 +226,69 @@ class ContractableBOSS(BaseClassifier):
 
         rng = check_random_state(self.random_state)
 
-        if time_limit > 0:
-            self.n_parameter_samples = 0
+        # a contract samples until the time runs out, otherwise n_parameter_samples
+        # are drawn, in both cases no more than the parameter space holds
+        n_samples = (
+            n_parameters
+            if time_limit > 0
+            else min(self.n_parameter_samples, n_parameters)
+        )
 
-        while (
-            train_time < time_limit or num_classifiers < self.n_parameter_samples
-        ) and len(possible_parameters) > 0:
-            parameters = possible_parameters.pop(
-                rng.randint(0, len(possible_parameters))
-            )
+        # parameter sets are drawn without replacement up front, the order of the
+        # permutation is the order they are fitted in
+        parameter_picks = rng.permutation(n_parameters)[:n_samples]
+
+        # reuse one pool of workers for the whole build, n_jobs=1 runs in process.
+        # joblib memory maps X once for the lifetime of the pool and hands the
+        # workers the memory map rather than a copy for every task
+        with Parallel(
+            n_jobs=self._n_jobs, prefer="processes", max_nbytes=0, mmap_mode="r"
+        ) as parallel:
+            for batch_start in range(0, n_samples, self._n_jobs):
+                if time_limit > 0 and train_time >= time_limit:
+                    break
+
+                # fit the next up to n_jobs parameter sets in parallel, the
+                # subsamples are drawn here so no worker touches rng
+                batch_picks = parameter_picks[batch_start : batch_start + self._n_jobs]
+                subsamples = [
+                    rng.choice(self.n_instances, size=subsample_size, replace=False)
+                    for _ in batch_picks
+                ]
+
+                # the ensemble lowest accuracy can only increase once the ensemble is
+                # full, so the value at dispatch is a safe early exit threshold
+                results = parallel(
+                    delayed(_fit_one)(
+                        possible_parameters[pick],
+                        subsample,
+                        X,
+                        y,
+                        0 if num_classifiers < self.max_ensemble_size else lowest_acc,
+                        self.alphabet_size,
+                        self.random_state,
+                    )
+                    for pick, subsample in zip(batch_picks, subsamples)
+                )
 
-            subsample = rng.choice(self.n_instances, size=subsample_size, replace=False)
-            X_subsample = X[subsample]
-            y_subsample = y[subsample]
+                for boss, accuracy, weight in results:
+                    if num_classifiers < self.max_ensemble_size:
+                        self.weights[num_classifiers] = weight
+                        accuracies[num_classifiers] = accuracy
+                        self.classifiers.append(boss)
+                    elif accuracy > lowest_acc:
+                        self.weights[lowest_acc_idx] = weight
+                        accuracies[lowest_acc_idx] = accuracy
+                        self.classifiers[lowest_acc_idx] = boss
 
-            boss = IndividualBOSS(
-                *parameters,
-                alphabet_size=self.alphabet_size,
-                save_words=False,
-                random_state=self.random_state,
-            )
-            boss.fit(X_subsample, y_subsample)
-            boss._clean()
-            boss.subsample = subsample
-
-            boss.accuracy = self._individual_train_acc(
-                boss,
-                y_subsample,
-                subsample_size,
-                0 if num_classifiers < self.max_ensemble_size else lowest_acc,
-            )
-            if boss.accuracy > 0:
-                weight = math.pow(boss.accuracy, 4)
-            else:
-                weight = 0.000000001
-
-            if num_classifiers < self.max_ensemble_size:
-                if boss.accuracy < lowest_acc:
-                    lowest_acc = boss.accuracy
-                    lowest_acc_idx = num_classifiers
-                self.weights.append(weight)
-                self.classifiers.append(boss)
-            elif boss.accuracy > lowest_acc:
-                self.weights[lowest_acc_idx] = weight
-                self.classifiers[lowest_acc_idx] = boss
-                lowest_acc, lowest_acc_idx = self._worst_ensemble_acc()
-
-            num_classifiers += 1
-            train_time = time.time() - start_time
+                    lowest_acc_idx = int(accuracies[: len(self.classifiers)].argmin())
+                    lowest_acc = accuracies[lowest_acc_idx]
+                    num_classifiers += 1
+
+                train_time = time.time() - start_time
 
         self.n_estimators = len(self.classifiers)
+        self.weights = self.weights[: self.n_estimators]
         self.weight_sum = np.sum(self.weights)
         return self
 
@@ -282,12 +306,16 @@ class ContractableBOSS(BaseClassifier):
             Predicted class.
         """
         rng = check_random_state(self.random_state)
-        return np.array(
-            [
-                self.classes_[int(rng.choice(np.flatnonzero(prob == prob.max())))]
-                for prob in self.predict_proba(X)
-            ]
-        )
+        probs = self.predict_proba(X)
+        preds = probs.argmax(axis=1)
+
+        # only rows with more than one most probable class need a random tie break
+        max_probs = probs.max(axis=1)
+        ties = np.flatnonzero((probs == max_probs[:, None]).sum(axis=1) > 1)
+        for i in ties:
+            preds[i] = rng.choice(np.flatnonzero(probs[i] == max_probs[i]))
+
+        return self.classes_[preds]
 
     def _predict_proba(self, X):
         """Predict class probabilities for n instances in X.
@@ -301,27 +329,21 @@ class ContractableBOSS(BaseClassifier):
         dists : array of shape (n_instances, n_classes)
             Predicted probability of each class.
         """
-        sums = np.zeros((X.shape[0], self.n_classes))
-
-        for n, clf in enumerate(self.classifiers):
-            preds = clf.predict(X)
-            for i in range(0, X.shape[0]):
-                sums[i, self.class_dictionary[preds[i]]] += self.weights[n]
-
-        dists = sums / (np.ones(self.n_classes) * self.weight_sum)
+        preds = Parallel(n_jobs=self._n_jobs)(
+            delayed(clf.predict)(X) for clf in self.classifiers
+        )
 
-        return dists
+        n_instances = X.shape[0]
+        rows = np.tile(np.arange(n_instances), len(preds))
+        # classes_ is sorted, so a class index is its position in classes_
+        cols = np.searchsorted(self.classes_, np.concatenate(preds))
 
-    def _worst_ensemble_acc(self):
-        min_acc = 1.0
-        min_acc_idx = -1
+        sums = np.zeros((n_instances, self.n_classes))
+        np.add.at(sums, (rows, cols), np.repeat(self.weights, n_instances))
 
-        for c, classifier in enumerate(self.classifiers):
-            if classifier.accuracy < min_acc:
-                min_acc = classifier.accuracy
-                min_acc_idx = c
+        dists = sums / self.weight_sum
 
-        return min_acc, min_acc_idx
+        return dists
 
     def _unique_parameters(self, max_window, win_inc):
         possible_parameters = [
@@ -336,60 +358,90 @@ class ContractableBOSS(BaseClassifier):
     def _get_train_probs(self, X, y=None):
         num_inst = X.shape[0]
         results = np.zeros((num_inst, self.n_classes))
-        for i in range(num_inst):
-            divisor = 0
-            sums = np.zeros(self.n_classes)
-
-            clf_idx = []
-            for n, clf in enumerate(self.classifiers):
-                idx = np.where(clf.subsample == i)
-                if len(idx[0]) > 0:
-                    clf_idx.append([n, idx[0][0]])
-
-            preds = Parallel(n_jobs=self.n_jobs)(
-                delayed(self.classifiers[cls[0]]._train_predict)(
-                    cls[1],
-                )
-                for cls in clf_idx
-            )
+        divisors = np.zeros(num_inst)
 
-            for n, pred in enumerate(preds):
-                sums[self.class_dictionary.get(pred, -1)] += self.weights[clf_idx[n][0]]
-                divisor += self.weights[clf_idx[n][0]]
+        preds = Parallel(n_jobs=self._n_jobs)(
+            delayed(_train_predictions)(clf) for clf in self.classifiers
+        )
 
-            results[i] = (
-                np.ones(self.n_classes) * (1 / self.n_classes)
-                if divisor == 0
-                else sums / (np.ones(self.n_classes) * divisor)
-            )
+        # one vote per (classifier, subsample position) pair, grouped by classifier
+        rows = np.concatenate([clf.subsample for clf in self.classifiers])
+        cols = np.fromiter(
+            (self.class_dictionary.get(p, -1) for pred in preds for p in pred),
+            dtype=np.intp,
+            count=len(rows),
+        )
+        weights = np.repeat(
+            self.weights, [len(clf.subsample) for clf in self.classifiers]
+        )
 
-        return results
+        np.add.at(results, (rows, cols), weights)
+        np.add.at(divisors, rows, weights)
 
-    def _individual_train_acc(self, boss, y, train_size, lowest_acc):
-        correct = 0
-        required_correct = int(lowest_acc * train_size)
+        trained = divisors > 0
+        results[trained] /= divisors[trained, np.newaxis]
+        results[~trained] = 1 / self.n_classes
 
-        if self.n_jobs > 1:
-            c = Parallel(n_jobs=self.n_jobs)(
-                delayed(boss._train_predict)(
-                    i,
-                )
-                for i in range(train_size)
-            )
+        return results
 
-            for i in range(train_size):
-                if correct + train_size - i < required_correct:
-                    return -1
-                elif c[i] == y[i]:
-                    correct += 1
-        else:
-            for i in range(train_size):
-                if correct + train_size - i < required_correct:
-                    return -1
 
-                c = boss._train_predict(i)
+def _fit_one(parameters, subsample, X, y, lowest_acc, alphabet_size, random_state):
+    """Fit and estimate the train accuracy of a single cBOSS ensemble member."""
+    X_subsample = X[subsample]
+    y_subsample = y[subsample]
+    subsample_size = len(subsample)
+
+    boss = IndividualBOSS(
+        *parameters,
+        alphabet_size=alphabet_size,
+        save_words=False,
+        random_state=random_state,
+    )
+    boss.fit(X_subsample, y_subsample)
+    boss._clean()
+    boss._use_array_bags()
+    boss.subsample = subsample
+
+    boss.accuracy = _individual_train_acc(boss, y_subsample, subsample_size, lowest_acc)
+    if boss.accuracy > 0:
+        acc_sq = boss.accuracy * boss.accuracy
+        weight = acc_sq * acc_sq
+    else:
+        weight = 0.000000001
+
+    return boss, boss.accuracy, weight
+
+
+def _train_predictions(boss):
+    """Leave-one-out predictions of a cBOSS ensemble member on its subsample."""
+    return [boss._train_predict(i) for i in range(len(boss.subsample))]
+
+
+def _individual_train_acc(boss, y, train_size, lowest_acc):
+    correct = 0
+    required_correct = int(lowest_acc * train_size)
+    y = np.searchsorted(boss.classes_, y)
+
+    # predict in chunks of 32 instances, only checking between chunks whether the
+    # member can still beat the current worst ensemble member
+    for start in range(0, train_size, 32):
+        if correct + train_size - start < required_correct:
+            return -1
+
+        end = min(start + 32, train_size)
+        preds = np.fromiter(
+            (
+                boss.class_dictionary.get(boss._train_predict(i), -1)
+                for i in range(start, end)
+            ),
+            dtype=y.dtype,
+            count=end - start,
+        )
+        hits = preds == y[start:end]
+        correct += int(np.sum(hits))
 
-                if c == y[i]:
-                    correct += 1
+    # the per instance check last ran before the final prediction
+    if correct - hits[-1] + 1 < required_correct:
+        return -1
 
-        return correct / train_size
+    return correct / train_size
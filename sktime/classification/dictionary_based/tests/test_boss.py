@@ -3,6 +3,7 @@ import numpy as np
 from numpy import testing
 
 from sktime.classification.dictionary_based import BOSSEnsemble, IndividualBOSS
+from sktime.classification.dictionary_based._boss import boss_distance
 from sktime.datasets import load_gunpoint, load_italy_power_demand
 
 
@@ -50,6 +51,47 @@ def test_boss_on_power_demand():
     assert score >= 0.9
 
 
+def test_boss_distance_on_array_bags():
+    # load gunpoint data
+    X_train, y_train = load_gunpoint(split="train", return_X_y=True)
+    indices = np.random.RandomState(0).permutation(10)
+
+    # train IndividualBOSS and convert its histograms to sorted arrays
+    indiv_boss = IndividualBOSS(window_size=20, word_length=8, random_state=0)
+    indiv_boss.fit(X_train.iloc[indices], y_train[indices])
+    dict_bags = indiv_boss.transformed_data
+    array_bags = [indiv_boss._bag_to_arrays(bag) for bag in dict_bags]
+
+    # assert distances are the same, with and without early abandoning
+    dists = [boss_distance(a, b) for a in dict_bags for b in dict_bags]
+    best_dist = np.median(dists)
+    for i in range(len(dict_bags)):
+        for j in range(len(dict_bags)):
+            assert boss_distance(array_bags[i], array_bags[j]) == boss_distance(
+                dict_bags[i], dict_bags[j]
+            )
+            assert boss_distance(
+                array_bags[i], array_bags[j], best_dist
+            ) == boss_distance(dict_bags[i], dict_bags[j], best_dist)
+
+
+def test_individual_boss_refit_after_array_bags():
+    # load gunpoint data
+    X_train, y_train = load_gunpoint(split="train", return_X_y=True)
+    X_test, y_test = load_gunpoint(split="test", return_X_y=True)
+    indices = np.random.RandomState(0).permutation(10)
+
+    # train IndividualBOSS, switch to array histograms and train again
+    indiv_boss = IndividualBOSS(random_state=0)
+    indiv_boss.fit(X_train.iloc[indices], y_train[indices])
+    indiv_boss._use_array_bags()
+    indiv_boss.fit(X_train.iloc[indices], y_train[indices])
+
+    # assert the refitted classifier predicts as a fresh one does
+    probas = indiv_boss.predict_proba(X_test.iloc[indices])
+    testing.assert_array_equal(probas, individual_boss_gunpoint_probas)
+
+
 boss_gunpoint_probas = np.array(
     [
         [
@@ -39,47 +39,63 @@ def test_cboss_on_power_demand():
     assert score >= 0.9
 
 
+def test_contracted_cboss_does_not_overwrite_params():
+    # load gunpoint data
+    X_train, y_train = load_gunpoint(split="train", return_X_y=True)
+    indices = np.random.RandomState(0).permutation(10)
+
+    # train cBOSS under a time contract
+    cboss = ContractableBOSS(
+        time_limit_in_minutes=0.01, max_ensemble_size=2, random_state=0
+    )
+    params = cboss.get_params()
+    cboss.fit(X_train.iloc[indices], y_train[indices])
+
+    # assert the hyper-parameters are unchanged
+    assert cboss.get_params() == params
+
+
 cboss_gunpoint_probas = np.array(
     [
         [
-            0.0,
-            1.0,
+            0.09214361891219339,
+            0.9078563810878066,
         ],
         [
-            0.0,
-            1.0,
+            0.3549946676146464,
+            0.6450053323853537,
         ],
         [
-            0.6608256880733945,
-            0.33917431192660547,
+            0.6314255243512266,
+            0.36857447564877355,
         ],
         [
-            0.4999999999999999,
-            0.4999999999999999,
+            0.46071809456096696,
+            0.5392819054390332,
         ],
         [
             0.0,
             1.0,
         ],
         [
-            0.2797247706422018,
-            0.7202752293577981,
+            0.4471382865268398,
+            0.5528617134731604,
         ],
         [
-            0.0,
-            1.0,
+            0.17070742979025955,
+            0.8292925702097405,
         ],
         [
-            0.3898623853211009,
-            0.6101376146788989,
+            0.72356914326342,
+            0.27643085673658013,
         ],
         [
-            0.2797247706422018,
-            0.7202752293577981,
+            0.72356914326342,
+            0.27643085673658013,
         ],
         [
-            0.0,
-            1.0,
+            0.26285104870245296,
+            0.7371489512975471,
         ],
     ]
 )
@@ -38,44 +38,44 @@ def test_hivecote_v1_on_unit_test():
 hivecote_v1_unit_test_probas = np.array(
     [
         [
-            0.2896146167253226,
-            0.7103853832746773,
+            0.23687713105169367,
+            0.7631228689483063,
         ],
         [
-            0.6447393690503758,
-            0.3552606309496243,
+            0.7576910508020752,
+            0.2423089491979247,
         ],
         [
-            0.15131417882399237,
-            0.8486858211760075,
+            0.060845763832757735,
+            0.9391542361672423,
         ],
         [
-            0.7590323281846022,
-            0.24096767181539777,
+            0.8300977294437505,
+            0.16990227055624954,
         ],
         [
-            0.6898381899763045,
-            0.31016181002369553,
+            0.9180751103704982,
+            0.0819248896295019,
         ],
         [
-            0.9673810222787618,
-            0.032618977721238215,
+            0.9632596076126093,
+            0.0367403923873907,
         ],
         [
-            0.7512998662621914,
-            0.2487001337378087,
+            0.6529016917861343,
+            0.3470983082138658,
         ],
         [
-            0.0968229115699514,
-            0.9031770884300486,
+            0.10905650672349182,
+            0.8909434932765082,
         ],
         [
-            0.671922083209323,
-            0.328077916790677,
+            0.8197777166937609,
+            0.1802222833062391,
         ],
         [
-            0.8344539284716492,
-            0.16554607152835074,
+            0.9150488647218752,
+            0.08495113527812477,
         ],
     ]
 )
@@ -11,6 +11,7 @@ import pandas as pd
 from joblib import Parallel, delayed
 from numba import njit, types, NumbaTypeSafetyWarning
 from numba.typed import Dict
+from scipy.fft import rfft
 from sklearn.feature_selection import f_classif
 from sklearn.preprocessing import KBinsDiscretizer
 from sklearn.tree import DecisionTreeClassifier
@@ -285,28 +286,23 @@ class SFA(_PanelToPanelTransformer):
 
         last_word = -1
         repeat_words = 0
-        words = (
-            np.zeros(dfts.shape[0], dtype=np.int64)
-            if self.word_bits <= 64
-            else [0 for _ in range(dfts.shape[0])]
-        )
 
-        for window in range(dfts.shape[0]):
-            word_raw = (
-                SFA._create_word(
-                    dfts[window],
-                    self.word_length,
-                    self.alphabet_size,
-                    self.breakpoints,
-                    self.letter_bits,
-                )
-                if self.word_bits <= 64
-                else self._create_word_large(
-                    dfts[window],
-                )
+        # words for all windows are created in a single compiled call when they
+        # fit in 64 bits
+        if self.word_bits <= 64:
+            words = SFA._create_words(
+                dfts,
+                self.word_length,
+                self.alphabet_size,
+                self.breakpoints,
+                self.letter_bits,
             )
-            words[window] = word_raw
+            raw_words = words.tolist()
+        else:
+            words = [self._create_word_large(dft) for dft in dfts]
+            raw_words = words
 
+        for window, word_raw in enumerate(raw_words):
             repeat_word = (
                 self._add_to_pyramid(
                     bag, word_raw, last_word, window - int(repeat_words / 2)
@@ -414,9 +410,13 @@ class SFA(_PanelToPanelTransformer):
         total_num_windows = int(self.n_instances * num_windows_per_inst)
         breakpoints = np.zeros((self.word_length, self.alphabet_size))
 
+        # round and sort the coefficient values of every letter at once, adding
+        # zero turns the -0.0 np.round can produce into 0.0 as round() does
+        columns = np.round(dft[:, : self.word_length] * 100) / 100 + 0.0
+        columns.sort(axis=0)
+
         for letter in range(self.word_length):
-            res = [round(dft[i][letter] * 100) / 100 for i in range(total_num_windows)]
-            column = np.sort(np.array(res))
+            column = columns[:, letter]
 
             bin_index = 0
 
@@ -472,19 +472,20 @@ class SFA(_PanelToPanelTransformer):
         start = self.series_length - self.window_size
         split[-1] = series[start : self.series_length]
 
+        # all windows share a length, so the fft of every window is done in one
+        # call reusing a single cached plan
+        if not self.use_fallback_dft:
+            return self._fast_fourier_transform(np.vstack(split))
+
         result = np.zeros((len(split), self.dft_length), dtype=np.float64)
 
         for i, row in enumerate(split):
-            result[i] = (
-                self._discrete_fourier_transform(
-                    row,
-                    self.dft_length,
-                    self.norm,
-                    self.inverse_sqrt_win_size,
-                    self.lower_bounding,
-                )
-                if self.use_fallback_dft
-                else self._fast_fourier_transform(row)
+            result[i] = self._discrete_fourier_transform(
+                row,
+                self.dft_length,
+                self.norm,
+                self.inverse_sqrt_win_size,
+                self.lower_bounding,
             )
 
         return result
@@ -501,28 +502,30 @@ class SFA(_PanelToPanelTransformer):
 
         Returns
         -------
-        1D array of fourier term, real_0,imag_0, real_1, imag_1 etc, length
-        num_atts or
+        array of fourier terms along the last axis, real_0,imag_0, real_1,
+        imag_1 etc, length num_atts or
         num_atts-2 if if self.norm is True
         """
         # first two are real and imaginary parts
         start = 2 if self.norm else 0
 
-        s = np.std(series)
-        std = s if s > 1e-8 else 1
+        s = np.std(series, axis=-1, keepdims=True)
+        std = np.where(s > 1e-8, s, 1)
 
-        X_fft = np.fft.rfft(series)
+        # scipy keeps a cache of fft plans, which are reused across windows,
+        # series and transformers of the same window size
+        X_fft = rfft(series, axis=-1)
         reals = np.real(X_fft)
         imags = np.imag(X_fft)
 
         length = start + self.dft_length
-        dft = np.empty((length,), dtype=reals.dtype)
-        dft[0::2] = reals[: np.uint32(length / 2)]
-        dft[1::2] = imags[: np.uint32(length / 2)]
+        dft = np.empty(series.shape[:-1] + (length,), dtype=reals.dtype)
+        dft[..., 0::2] = reals[..., : np.uint32(length / 2)]
+        dft[..., 1::2] = imags[..., : np.uint32(length / 2)]
         if self.lower_bounding:
-            dft[1::2] = dft[1::2] * -1  # lower bounding
+            dft[..., 1::2] = dft[..., 1::2] * -1  # lower bounding
         dft *= self.inverse_sqrt_win_size / std
-        return dft[start:]
+        return dft[..., start:]
 
     @staticmethod
     @njit(fastmath=True, cache=True)
@@ -606,7 +609,7 @@ class SFA(_PanelToPanelTransformer):
                 cut_start_if_norm=False,
             )
         else:
-            X_fft = np.fft.rfft(series[: self.window_size])
+            X_fft = rfft(series[: self.window_size])
             reals = np.real(X_fft)
             imags = np.imag(X_fft)
             mft_data = np.empty((length,), dtype=reals.dtype)
@@ -825,15 +828,18 @@ class SFA(_PanelToPanelTransformer):
 
     @staticmethod
     @njit(fastmath=True, cache=True)
-    def _create_word(dft, word_length, alphabet_size, breakpoints, letter_bits):
-        word = np.int64(0)
-        for i in range(word_length):
-            for bp in range(alphabet_size):
-                if dft[i] <= breakpoints[i][bp]:
-                    word = (word << letter_bits) | bp
-                    break
-
-        return word
+    def _create_words(dfts, word_length, alphabet_size, breakpoints, letter_bits):
+        words = np.zeros(dfts.shape[0], dtype=np.int64)
+        for window in range(dfts.shape[0]):
+            word = np.int64(0)
+            for i in range(word_length):
+                for bp in range(alphabet_size):
+                    if dfts[window][i] <= breakpoints[i][bp]:
+                        word = (word << letter_bits) | bp
+                        break
+            words[window] = word
+
+        return words
 
     def _create_word_large(self, dft):
         word = 0